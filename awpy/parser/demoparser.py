@@ -22,12 +22,26 @@ Example::
 https://github.com/pnxenopoulos/awpy/blob/main/examples/00_Parsing_a_CSGO_Demofile.ipynb
 """
 
+import contextlib
 import json
 import logging
 import os
 import subprocess
-from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Literal, Unpack, get_args, overload
+import tempfile
+from collections.abc import Callable, Collection
+from itertools import chain, compress
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Literal,
+    NoReturn,
+    Self,
+    Unpack,
+    get_args,
+    overload,
+)
 
 import pandas as pd
 from pydantic import TypeAdapter, ValidationError
@@ -37,6 +51,8 @@ from awpy.types import (
     FullParserArgs,
     Game,
     GameActionKey,
+    GameFrame,
+    GameHeader,
     GameRound,
     ParserArgs,
     ParseRate,
@@ -45,9 +61,93 @@ from awpy.types import (
 )
 from awpy.utils import check_go_version
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from pandas.core.arrays.base import ExtensionArray
 
+# Building the core schema is the expensive part, so only do it once.
+_GAME_HEADER_ADAPTER = TypeAdapter(GameHeader)
+_GAME_ROUND_ADAPTER = TypeAdapter(GameRound)
+
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Directories in which building the Go parser failed during this process.
+_FAILED_GO_BUILDS: set[str] = set()
+
+_JSON_NOT_FOUND_MSG = (
+    "JSON not found. Run .parse() or .read_json() if JSON already exists"
+)
+
+_BAD_ROUND_ENDINGS = frozenset(("Draw", "Unknown", ""))
+
+# Rounds with more players on a side or more kills than this are not real.
+_MAX_TEAM_PLAYERS = 5
+_MAX_ROUND_KILLS = 2 * _MAX_TEAM_PLAYERS
+
+_VALID_BUY_STYLES: tuple[BuyStyle, ...] = get_args(BuyStyle)
+
+# Order in which the action tables are put into parse_json_to_df's output.
+_GAME_ACTIONS: tuple[GameActionKey, ...] = (
+    "kills",
+    "damages",
+    "grenades",
+    "flashes",
+    "weaponFires",
+    "bombEvents",
+)
+
+# Round columns following roundNum, matchID and mapName in _parse_rounds.
+_ROUND_COLUMNS = (
+    "startTick",
+    "freezeTimeEndTick",
+    "endTick",
+    "endOfficialTick",
+    "tScore",
+    "ctScore",
+    "endTScore",
+    "endCTScore",
+    "tTeam",
+    "ctTeam",
+    "winningSide",
+    "winningTeam",
+    "losingTeam",
+    "roundEndReason",
+    "ctFreezeTimeEndEqVal",
+    "ctRoundStartEqVal",
+    "ctRoundSpendMoney",
+    "ctBuyType",
+    "tFreezeTimeEndEqVal",
+    "tRoundStartEqVal",
+    "tRoundSpendMoney",
+    "tBuyType",
+)
+
+_FRAME_COLUMNS = (
+    "roundNum",
+    "tick",
+    "seconds",
+    "ctTeamName",
+    "ctEqVal",
+    "ctAlivePlayers",
+    "ctUtility",
+    "tTeamName",
+    "tEqVal",
+    "tAlivePlayers",
+    "tUtility",
+)
+
+# Fetches the per team frame columns in _FRAME_COLUMNS order in one call.
+_TEAM_FRAME_GETTER = itemgetter("teamName", "teamEqVal", "alivePlayers", "totalUtility")
+
+# Fetches the round ticks compared by _has_valid_timings in one call.
+_ROUND_TICK_GETTER = itemgetter(
+    "startTick", "endTick", "endOfficialTick", "freezeTimeEndTick"
+)
+
 
 class DemoParser:
     """DemoParser can parse, load and clean data from a CSGO demofile.
@@ -87,6 +187,16 @@ class DemoParser:
         ValueError: Raises a ValueError if the Golang version is lower than 1.18
     """
 
+    __slots__ = (
+        "logger",
+        "demofile",
+        "demo_id",
+        "output_file",
+        "parser_args",
+        "parse_error",
+        "_json",
+    )
+
     def __init__(
         self,
         *,
@@ -162,10 +272,8 @@ class DemoParser:
 
         self.logger.info("Setting demo id to %s", self.demo_id)
 
-        if outpath is None:
-            outpath = os.path.abspath(os.getcwd())
-        else:
-            outpath = os.path.abspath(outpath)
+        # os.getcwd() is already absolute.
+        outpath = os.getcwd() if outpath is None else os.path.abspath(outpath)
         self.output_file = os.path.join(outpath, self.demo_id + ".json")
 
         self.parser_args: FullParserArgs = {
@@ -195,16 +303,16 @@ class DemoParser:
 
     def log_settings(self) -> None:
         """Log the settings produced in the constructor."""
-        self.logger.info("Rollup damages set to %s", str(self.dmg_rolled))
-        self.logger.info("Parse chat set to %s", str(self.parse_chat))
-        self.logger.info("Parse frames set to %s", str(self.parse_frames))
-        self.logger.info("Parse kill frames set to %s", str(self.parse_kill_frames))
+        self.logger.info("Rollup damages set to %s", self.dmg_rolled)
+        self.logger.info("Parse chat set to %s", self.parse_chat)
+        self.logger.info("Parse frames set to %s", self.parse_frames)
+        self.logger.info("Parse kill frames set to %s", self.parse_kill_frames)
         self.logger.info(
             "Output json indentation set to %s",
-            str(self.json_indentation),
+            self.json_indentation,
         )
         self.logger.info("Setting trade time to %d", self.trade_time)
-        self.logger.info("Setting buy style to %s", str(self.buy_style))
+        self.logger.info("Setting buy style to %s", self.buy_style)
 
     @property
     def json(self) -> Game | None:
@@ -223,18 +331,41 @@ class DemoParser:
             new_json (Game | None): Game dict to use.
         """
         if new_json is not None:
-            try:
-                TypeAdapter(Game).validate_python(new_json)
-            except ValidationError as e:
-                # Do not always want to log the whole exception.
-                self.logger.error(  # noqa: TRY400
-                    "Loaded json file does not have correct fields."
-                    " This may cause issues later."
-                    " Enable debug output to see the differences."
-                )
-                self.logger.debug(e)
+            self._validate_game(new_json)
         self._json = new_json
 
+    def _validate_game(self, game_data: Game) -> None:
+        """Validate the shape of game data via pydantic.
+
+        Only the top level fields and the first round are validated.
+        Every round has the same shape, so walking all of them
+        (including every frame and event) would not tell us more.
+
+        Args:
+            game_data (Game): Game dict to validate.
+        """
+        try:
+            _GAME_HEADER_ADAPTER.validate_python(game_data)
+            if game_rounds := game_data["gameRounds"]:
+                _GAME_ROUND_ADAPTER.validate_python(game_rounds[0])
+        except ValidationError as e:
+            # Do not always want to log the whole exception.
+            self.logger.error(  # noqa: TRY400
+                "Loaded json file does not have correct fields."
+                " This may cause issues later."
+                " Enable debug output to see the differences."
+            )
+            self.logger.debug(e)
+
+    def _raise_json_not_found(self) -> NoReturn:
+        """Log and raise the error for methods that need a parsed or read JSON.
+
+        Raises:
+            AttributeError: Always.
+        """
+        self.logger.error(_JSON_NOT_FOUND_MSG)
+        raise AttributeError(_JSON_NOT_FOUND_MSG)
+
     @property
     def buy_style(self) -> BuyStyle:
         """buy_style getter.
@@ -406,7 +537,7 @@ class DemoParser:
             self.logger.warning(
                 "Parse rate of %s not acceptable! "
                 "Parse rate must be an integer greater than 0.",
-                str(self.parse_rate),
+                self.parse_rate,
             )
             self.parser_args["parse_rate"] = 128
         elif 1 < self.parse_rate < parse_rate_lower_bound:
@@ -420,19 +551,19 @@ class DemoParser:
                 "A high parse rate means very few frames. "
                 "Only use for testing purposes."
             )
-        self.logger.info("Setting parse rate to %s", str(self.parse_rate))
+        self.logger.info("Setting parse rate to %s", self.parse_rate)
 
     def _check_buy_style(self) -> None:
         """Check that buy style is valid."""
         # Handle parse rate. If the parse rate is less than 64, likely to be slow
-        if self.buy_style not in get_args(BuyStyle):
+        if self.buy_style not in _VALID_BUY_STYLES:
             self.logger.warning(
                 "Buy style specified is not one of %s, "
                 "will be set to hltv by default",
-                get_args(BuyStyle),
+                _VALID_BUY_STYLES,
             )
             self.parser_args["buy_style"] = "hltv"
-        self.logger.info("Setting buy style to %s", str(self.buy_style))
+        self.logger.info("Setting buy style to %s", self.buy_style)
 
     def _set_demo_id(self, demo_id: str | None, demofile: str) -> None:
         """Set demo_id.
@@ -451,14 +582,20 @@ class DemoParser:
         else:
             self.demo_id = demo_id
 
-    def parse_demo(self) -> None:
+    def parse_demo(self, *, stream: bool = False) -> None:
         """Parse a demofile using the Go script parse_demo.go.
 
         This function needs the .demofile to be set in the class,
         and the file needs to exist.
 
+        Args:
+            stream (bool, optional): Whether the Go parser should stream its
+                JSON output directly into the `json` attribute instead of
+                writing it to the output file. Defaults to False.
+
         Returns:
-            Outputs a JSON file to current working directory.
+            Outputs a JSON file to current working directory,
+            or sets the `json` attribute if stream is True.
 
         Raises:
             ValueError: Raises a ValueError if the Golang version is lower than 1.18
@@ -478,7 +615,8 @@ class DemoParser:
         self.logger.info("Go version>=1.18.0")
 
         # Check if demofile exists
-        if not os.path.exists(os.path.abspath(self.demofile)):
+        # self.demofile is already made absolute in __init__
+        if not os.path.exists(self.demofile):
             msg = "Demofile path does not exist!"
             self.logger.error(msg)
             raise FileNotFoundError(msg)
@@ -487,9 +625,7 @@ class DemoParser:
         self.logger.info("Running Golang parser from %s", path)
         self.logger.info("Looking for file at %s", self.demofile)
         parser_cmd = [
-            "go",
-            "run",
-            "parse_demo.go",
+            *self._get_go_parser_cmd(path),
             "-demo",
             self.demofile,
             "-parserate",
@@ -501,7 +637,7 @@ class DemoParser:
             "-demoid",
             str(self.demo_id),
             "-out",
-            os.path.dirname(self.output_file),
+            "-" if stream else os.path.dirname(self.output_file),
         ]
         if self.dmg_rolled:
             parser_cmd.append("--dmgrolled")
@@ -514,29 +650,120 @@ class DemoParser:
         if self.parse_chat:
             parser_cmd.append("--parsechat")
         self.logger.debug(parser_cmd)
-        with subprocess.Popen(
+        proc = subprocess.run(
             parser_cmd,  # noqa: S603
-            stdout=subprocess.PIPE,
+            capture_output=True,
             cwd=path,
-        ) as proc:
-            stdout = (
-                proc.stdout.read().splitlines() if proc.stdout is not None else None
-            )
-        if os.path.isfile(self.output_file):
+            check=False,
+        )
+        if stream:
+            if proc.returncode == 0 and proc.stdout:
+                # Output of the bundled Go parser has a known shape.
+                self._load_json_bytes(proc.stdout, validate=False)
+                self.logger.info("Streamed demo parse output into the json attribute")
+                self.parse_error = False
+            else:
+                self.parse_error = True
+                self._json = None
+                self.logger.error("No output streamed, error in calling Golang")
+                self.logger.error(proc.stderr.splitlines())
+        elif os.path.isfile(self.output_file):
             self.logger.info("Wrote demo parse output to %s", self.output_file)
             self.parse_error = False
         else:
             self.parse_error = True
             self.logger.error("No file produced, error in calling Golang")
-            self.logger.error(stdout)
+            self.logger.error(proc.stdout.splitlines())
+            self.logger.error(proc.stderr.splitlines())
+
+    def _get_go_parser_cmd(self, path: str) -> list[str]:
+        """Get the command that runs the Go parser.
+
+        The Go parser is compiled once into a binary next to parse_demo.go
+        and only rebuilt when the Go sources are newer than the binary.
+        This avoids recompiling on every parse as `go run` would.
+        Falls back to `go run` if the binary can not be built.
 
-    def read_json(self, json_path: str) -> Game:
+        Args:
+            path (str): Directory containing parse_demo.go
+
+        Returns:
+            list[str]: Command to run the Go parser with.
+        """
+        binary = os.path.join(
+            path, "parse_demo.exe" if os.name == "nt" else "parse_demo"
+        )
+        sources = ("parse_demo.go", "go.mod", "go.sum")
+        try:
+            is_stale = os.path.getmtime(binary) < max(
+                os.path.getmtime(os.path.join(path, source)) for source in sources
+            )
+        except OSError:
+            is_stale = True
+        # Do not retry a build that already failed in this process,
+        # e.g. because awpy is installed into a read-only location.
+        if is_stale and (
+            path in _FAILED_GO_BUILDS or not self._build_go_parser(path, binary)
+        ):
+            _FAILED_GO_BUILDS.add(path)
+            self.logger.warning(
+                "Could not build Golang parser, falling back to 'go run'."
+            )
+            return ["go", "run", "parse_demo.go"]
+        return [binary]
+
+    def _build_go_parser(self, path: str, binary: str) -> bool:
+        """Build the Go parser binary.
+
+        The binary is built under a temporary name in the same directory
+        and then renamed into place. Other processes therefore never see
+        (and run) a partially written binary.
+
+        Args:
+            path (str): Directory containing parse_demo.go
+            binary (str): Path the binary should end up at.
+
+        Returns:
+            bool: Whether the binary was built.
+        """
+        self.logger.info("Building Golang parser to %s", binary)
+        try:
+            tmp_fd, tmp_binary = tempfile.mkstemp(
+                prefix="parse_demo.", suffix=".tmp", dir=path
+            )
+        except OSError as e:
+            self.logger.debug(e)
+            return False
+        os.close(tmp_fd)
+        try:
+            build = subprocess.run(
+                ["go", "build", "-o", tmp_binary, "parse_demo.go"],  # noqa: S603, S607
+                capture_output=True,
+                cwd=path,
+                check=False,
+            )
+            if build.returncode != 0:
+                self.logger.debug(build.stderr.splitlines())
+                return False
+            os.replace(tmp_binary, binary)
+        except OSError as e:
+            self.logger.debug(e)
+            return False
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_binary)
+        return True
+
+    def read_json(self, json_path: str, *, validate: bool = True) -> Game:
         """Reads the JSON file given a JSON path.
 
         Can be used to read in already processed demofiles.
 
         Args:
             json_path (string): Path to JSON file
+            validate (bool, optional): Whether to validate the shape of the JSON
+                via pydantic. Can be skipped for output that was just produced
+                by the Go parser. Defaults to True.
 
         Returns (Game):
             JSON in Python dictionary form
@@ -551,27 +778,56 @@ class DemoParser:
             raise FileNotFoundError(msg)
 
         # Read in json to .json attribute
-        with open(json_path, encoding="utf8") as game_data:
-            demo_data: Game = json.load(game_data)
+        # orjson is considerably faster than the stdlib for large demos.
+        # Both accept the raw bytes, so no decoding step is needed.
+        with open(json_path, "rb") as game_data:
+            demo_data = self._load_json_bytes(game_data.read(), validate=validate)
 
-        self.json = demo_data
         self.logger.info(
             "JSON data loaded, available in the `json` attribute to parser"
         )
         return demo_data
 
+    def _load_json_bytes(self, raw_data: bytes, *, validate: bool) -> Game:
+        """Decode raw JSON bytes into the `json` attribute.
+
+        Args:
+            raw_data (bytes): Raw JSON output of the Go parser.
+            validate (bool): Whether to validate the shape of the JSON.
+
+        Returns:
+            Game: The decoded game dict.
+        """
+        demo_data: Game = (
+            orjson.loads(raw_data) if orjson is not None else json.loads(raw_data)
+        )
+        if validate:
+            self._validate_game(demo_data)
+        self._json = demo_data
+        return demo_data
+
     @overload
     def parse(
-        self, *, return_type: Literal["json"] = "json", clean: bool = ...
+        self,
+        *,
+        return_type: Literal["json"] = "json",
+        clean: bool = ...,
+        stream: bool = ...,
     ) -> Game:
         ...
 
     @overload
-    def parse(self, *, return_type: Literal["df"], clean: bool = ...) -> dict[str, Any]:
+    def parse(
+        self, *, return_type: Literal["df"], clean: bool = ..., stream: bool = ...
+    ) -> dict[str, Any]:
         ...
 
     def parse(
-        self, *, return_type: RoundReturnType = "json", clean: bool = True
+        self,
+        *,
+        return_type: RoundReturnType = "json",
+        clean: bool = True,
+        stream: bool = False,
     ) -> Game | dict[str, Any]:
         """Wrapper for parse_demo() and read_json(). Use to parse a demo.
 
@@ -579,6 +835,9 @@ class DemoParser:
             return_type (string, optional): Either "json" or "df". Default is "json"
             clean (bool, optional): True to run clean_rounds.
                 Otherwise, uncleaned data is returned. Defaults to True.
+            stream (bool, optional): True to stream the Go parser output
+                directly into Python instead of round-tripping through
+                the output JSON file. Defaults to False.
 
         Returns:
             A dictionary of output which
@@ -588,8 +847,10 @@ class DemoParser:
             ValueError: Raises a ValueError if the return_type is not "json" or "df"
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        self.parse_demo()
-        self.read_json(json_path=self.output_file)
+        self.parse_demo(stream=stream)
+        if not stream:
+            # Output of the bundled Go parser has a known shape.
+            self.read_json(json_path=self.output_file, validate=False)
         if clean:
             self.clean_rounds()
         if self.json:
@@ -617,39 +878,23 @@ class DemoParser:
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            demo_data: dict[str, Any] = {
-                "matchID": self.json["matchID"],
-                "clientName": self.json["clientName"],
-                "mapName": self.json["mapName"],
-                "tickRate": self.json["tickRate"],
-                "playbackTicks": self.json["playbackTicks"],
-                "rounds": self._parse_rounds(),
-            }
-            # Kills
-            demo_data["kills"] = self._parse_action("kills")
-            # Damages
-            demo_data["damages"] = self._parse_action("damages")
-            # Grenades
-            demo_data["grenades"] = self._parse_action("grenades")
-            # Flashes
-            demo_data["flashes"] = self._parse_action("flashes")
-            # Weapon Fires
-            demo_data["weaponFires"] = self._parse_action("weaponFires")
-            # Bomb Events
-            demo_data["bombEvents"] = self._parse_action("bombEvents")
-            # Frames
-            demo_data["frames"] = self._parse_frames()
-            # Player Frames
-            demo_data["playerFrames"] = self._parse_player_frames()
-            self.logger.info("Returned dataframe output")
-            return demo_data
-        msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-        self.logger.error(msg)
-        raise AttributeError(msg)
+        if not (game_data := self.json):
+            self._raise_json_not_found()
+        demo_data: dict[str, Any] = {
+            "matchID": game_data["matchID"],
+            "clientName": game_data["clientName"],
+            "mapName": game_data["mapName"],
+            "tickRate": game_data["tickRate"],
+            "playbackTicks": game_data["playbackTicks"],
+        }
+        demo_data["rounds"] = self._parse_rounds()
+        for action in _GAME_ACTIONS:
+            demo_data[action] = self._parse_action(action)
+        demo_data["frames"], demo_data["playerFrames"] = self._parse_frame_tables()
+        self.logger.info("Returned dataframe output")
+        return demo_data
 
-    # Can not easily extract due to type checking
-    def _parse_frames(self) -> pd.DataFrame:  # sourcery skip: extract-method
+    def _parse_frames(self) -> pd.DataFrame:
         """Returns frames as a Pandas dataframe.
 
         Returns:
@@ -659,29 +904,7 @@ class DemoParser:
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            frames_dataframes = []
-            for game_round in self.json["gameRounds"] or []:
-                for frame in game_round["frames"] or []:
-                    frame_item: dict[str, Any] = {"roundNum": game_round["roundNum"]}
-                    for k in ("tick", "seconds"):
-                        frame_item[k] = frame[k]
-                    frame_item["ctTeamName"] = frame["ct"]["teamName"]
-                    frame_item["ctEqVal"] = frame["ct"]["teamEqVal"]
-                    frame_item["ctAlivePlayers"] = frame["ct"]["alivePlayers"]
-                    frame_item["ctUtility"] = frame["ct"]["totalUtility"]
-                    frame_item["tTeamName"] = frame["t"]["teamName"]
-                    frame_item["tEqVal"] = frame["t"]["teamEqVal"]
-                    frame_item["tAlivePlayers"] = frame["t"]["alivePlayers"]
-                    frame_item["tUtility"] = frame["t"]["totalUtility"]
-                    frames_dataframes.append(frame_item)
-            frames_df = pd.DataFrame(frames_dataframes)
-            frames_df["matchID"] = self.json["matchID"]
-            frames_df["mapName"] = self.json["mapName"]
-            return pd.DataFrame(frames_dataframes)
-        msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-        self.logger.error(msg)
-        raise AttributeError(msg)
+        return self._parse_frame_tables(with_player_frames=False)[0]
 
     def add_player_specific_information(
         self, player_item: dict[str, Any], player: PlayerInfo
@@ -699,8 +922,6 @@ class DemoParser:
                 player_item[col] = val
 
     def _parse_player_frames(self) -> pd.DataFrame:
-        # Can not easily extract due to type checking
-        # sourcery skip: extract-method
         """Returns player frames as a Pandas dataframe.
 
         Returns:
@@ -710,31 +931,89 @@ class DemoParser:
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            player_frames = []
-            for game_round in self.json["gameRounds"] or []:
-                for frame in game_round["frames"] or []:
-                    for side in ("ct", "t"):
-                        players = frame[side]["players"]
-                        if players is None:
-                            continue
-                        for player in players:
-                            player_item: dict[str, Any] = {
-                                "roundNum": game_round["roundNum"],
-                                "tick": frame["tick"],
-                                "seconds": frame["seconds"],
-                                "side": side,
-                                "teamName": frame[side]["teamName"],
-                            }
-                            self.add_player_specific_information(player_item, player)
-                            player_frames.append(player_item)
-            player_frames_df = pd.DataFrame(player_frames)
-            player_frames_df["matchID"] = self.json["matchID"]
-            player_frames_df["mapName"] = self.json["mapName"]
-            return pd.DataFrame(player_frames_df)
-        msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-        self.logger.error(msg)
-        raise AttributeError(msg)
+        return self._parse_frame_tables()[1]
+
+    # Can not easily extract due to type checking
+    def _parse_frame_tables(
+        self, *, with_player_frames: bool = True
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        # sourcery skip: extract-method
+        """Returns frames and player frames as Pandas dataframes.
+
+        Both tables are built in a single pass over the frames
+        so that the (potentially huge) frame list is only walked once.
+
+        Args:
+            with_player_frames (bool, optional): Whether to build the player
+                frames. They are by far the more expensive table, so callers
+                that only need the frames should skip them. Defaults to True.
+
+        Returns:
+            A tuple of the frames dataframe, where each row is a frame,
+            and the player frames dataframe, where each row is a player's
+            attributes at a given frame. The player frames dataframe is
+            empty if with_player_frames is False.
+
+        Raises:
+            AttributeError: Raises an AttributeError if the .json attribute is None
+        """
+        if not (game_data := self.json):
+            self._raise_json_not_found()
+        frame_rows: list[tuple[Any, ...]] = []
+        player_frames: list[dict[str, Any]] = []
+        for game_round in game_data["gameRounds"] or ():
+            round_num = game_round["roundNum"]
+            for frame in game_round["frames"] or ():
+                ct_team = frame["ct"]
+                t_team = frame["t"]
+                # Plain tuples in _FRAME_COLUMNS order avoid building
+                # and aligning one dict per frame.
+                frame_rows.append(
+                    (
+                        round_num,
+                        frame["tick"],
+                        frame["seconds"],
+                        *_TEAM_FRAME_GETTER(ct_team),
+                        *_TEAM_FRAME_GETTER(t_team),
+                    )
+                )
+                if with_player_frames:
+                    self._add_player_frame_rows(player_frames, round_num, frame)
+        # matchID and mapName are constant, so they are broadcast
+        # once instead of being stored in every row.
+        frames_df = pd.DataFrame(frame_rows, columns=_FRAME_COLUMNS)
+        frames_df["matchID"] = game_data["matchID"]
+        frames_df["mapName"] = game_data["mapName"]
+        player_frames_df = pd.DataFrame(player_frames)
+        player_frames_df["matchID"] = game_data["matchID"]
+        player_frames_df["mapName"] = game_data["mapName"]
+        return frames_df, player_frames_df
+
+    @staticmethod
+    def _add_player_frame_rows(
+        player_frames: list[dict[str, Any]], round_num: int, frame: GameFrame
+    ) -> None:
+        """Append one player frame row per player in the frame.
+
+        Args:
+            player_frames (list[dict[str, Any]]): Rows to append to.
+            round_num (int): Number of the round the frame belongs to.
+            frame (GameFrame): Frame to build the rows from.
+        """
+        for side, team in (("ct", frame["ct"]), ("t", frame["t"])):
+            frame_info: dict[str, Any] = {
+                "roundNum": round_num,
+                "tick": frame["tick"],
+                "seconds": frame["seconds"],
+                "side": side,
+                "teamName": team["teamName"],
+            }
+            for player in team["players"] or ():
+                # Merging the dicts happens in C instead of
+                # copying every player key over in Python.
+                player_item: dict[str, Any] = {**frame_info, **player}
+                player_item.pop("inventory", None)
+                player_frames.append(player_item)
 
     def _parse_rounds(self) -> pd.DataFrame:
         """Returns rounds as a Pandas dataframe.
@@ -745,44 +1024,21 @@ class DemoParser:
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            rounds = []
-            cols = (
-                "roundNum",
-                "startTick",
-                "freezeTimeEndTick",
-                "endTick",
-                "endOfficialTick",
-                "tScore",
-                "ctScore",
-                "endTScore",
-                "endCTScore",
-                "tTeam",
-                "ctTeam",
-                "winningSide",
-                "winningTeam",
-                "losingTeam",
-                "roundEndReason",
-                "ctFreezeTimeEndEqVal",
-                "ctRoundStartEqVal",
-                "ctRoundSpendMoney",
-                "ctBuyType",
-                "tFreezeTimeEndEqVal",
-                "tRoundStartEqVal",
-                "tRoundSpendMoney",
-                "tBuyType",
-            )
-            for game_round in self.json["gameRounds"] or []:
-                round_item: dict[str, Any] = {}
-                for k in cols:
-                    round_item[k] = game_round[k]
-                    round_item["matchID"] = self.json["matchID"]
-                    round_item["mapName"] = self.json["mapName"]
-                rounds.append(round_item)
-            return pd.DataFrame(rounds)
-        msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-        self.logger.error(msg)
-        raise AttributeError(msg)
+        if not (game_data := self.json):
+            self._raise_json_not_found()
+        match_id = game_data["matchID"]
+        map_name = game_data["mapName"]
+        rounds = []
+        for game_round in game_data["gameRounds"] or ():
+            round_item: dict[str, Any] = {
+                "roundNum": game_round["roundNum"],
+                "matchID": match_id,
+                "mapName": map_name,
+            }
+            for k in _ROUND_COLUMNS:
+                round_item[k] = game_round[k]
+            rounds.append(round_item)
+        return pd.DataFrame(rounds)
 
     def _parse_action(self, action: GameActionKey) -> pd.DataFrame:
         """Returns action as a Pandas dataframe.
@@ -796,23 +1052,28 @@ class DemoParser:
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            actions: dict[str, list] = defaultdict(list)
-            for game_round in self.json["gameRounds"] or []:
-                for game_action in game_round[action] or []:
-                    for key, value in game_action.items():
-                        actions[key].append(value)
-                    actions["roundNum"].append(game_round["roundNum"])
-                    actions["matchID"].append(self.json["matchID"])
-                    actions["mapName"].append(self.json["mapName"])
-            # pd.array automatically infors nullable ints.
-            actions_array: dict[str, ExtensionArray] = {
-                key: pd.array(value_list) for key, value_list in actions.items()
-            }
-            return pd.DataFrame(actions_array)
-        msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-        self.logger.error(msg)
-        raise AttributeError(msg)
+        if not (game_data := self.json):
+            self._raise_json_not_found()
+        game_rounds = game_data["gameRounds"] or ()
+        if not any(game_round[action] for game_round in game_rounds):
+            return pd.DataFrame(columns=["roundNum", "matchID", "mapName"])
+        game_actions: list[Any] = []
+        round_nums: list[int] = []
+        for game_round in game_rounds:
+            round_actions = game_round[action] or ()
+            game_actions.extend(round_actions)
+            round_nums.extend([game_round["roundNum"]] * len(round_actions))
+        # Let pandas assemble the rows into columns in C.
+        # dtype=object stops it from casting ints with None to float.
+        actions_df = pd.DataFrame(game_actions, dtype=object)
+        actions_df["roundNum"] = round_nums
+        actions_df["matchID"] = game_data["matchID"]
+        actions_df["mapName"] = game_data["mapName"]
+        # pd.array automatically infers nullable ints.
+        actions_array: dict[str, ExtensionArray] = {
+            key: pd.array(column.to_numpy()) for key, column in actions_df.items()
+        }
+        return pd.DataFrame(actions_array)
 
     @overload
     def clean_rounds(
@@ -890,404 +1151,467 @@ class DemoParser:
         Returns:
             dict: A dictionary of the cleaned demo.
         """
-        if self.json:
-            if remove_no_frames:
-                self.remove_rounds_with_no_frames()
-            if remove_warmups:
-                self.remove_warmups()
-            if remove_knifes:
-                self.remove_knife_rounds()
-            if remove_bad_timings:
-                self.remove_time_rounds()
-            if remove_excess_players:
-                self.remove_excess_players()
-            if remove_excess_kills:
-                self.remove_excess_kill_rounds()
-            if remove_bad_endings:
-                self.remove_end_round()
-            if remove_bad_scoring:
-                self.remove_bad_scoring()
-            self.renumber_rounds()
-            self.renumber_frames()
-            # self.rescore_rounds() -- Need to edit to take into account half switches
-            if save_to_json:
-                self.write_json()
-            if return_type == "json":
-                return self.json
-            if return_type == "df":
-                demo_data = self.parse_json_to_df()
-                self.logger.info("Returned cleaned dataframe output")
-                return demo_data
-            msg = f"Invalid return_type of {return_type}. Use 'json' or 'df' instead!"
-            raise ValueError(msg)
-        msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-        self.logger.error(msg)
-        raise AttributeError(msg)
+        if not self.json:
+            self._raise_json_not_found()
+        # The per round cleaners are independent of each other,
+        # so apply them all in one pass. Cheap checks go first.
+        round_filters = [
+            predicate
+            for enabled, predicate in (
+                (remove_warmups, self._is_not_warmup),
+                (remove_bad_timings, self._has_valid_timings),
+                (remove_bad_endings, self._has_good_ending),
+                (
+                    remove_no_frames and self._can_clean_frames("remove_no_frames"),
+                    self._has_frames,
+                ),
+                (
+                    remove_excess_players
+                    and self._can_clean_frames("remove_excess_players"),
+                    self._has_valid_player_counts,
+                ),
+                (remove_excess_kills, self._has_valid_kill_count),
+                (remove_knifes, self._is_not_knife_round),
+            )
+            if enabled
+        ]
+        if round_filters:
+            self._filter_rounds(*round_filters)
+        # Needs the neighbouring rounds, so it runs on the filtered list.
+        if remove_bad_scoring:
+            self.remove_bad_scoring()
+        self.renumber_rounds()
+        self.renumber_frames()
+        # self.rescore_rounds() -- Need to edit to take into account half switches
+        if save_to_json:
+            self.write_json()
+        if return_type == "json":
+            return self.json
+        if return_type == "df":
+            demo_data = self.parse_json_to_df()
+            self.logger.info("Returned cleaned dataframe output")
+            return demo_data
+        msg = f"Invalid return_type of {return_type}. Use 'json' or 'df' instead!"
+        raise ValueError(msg)
 
     def write_json(self) -> None:
-        """Rewrite the JSON file."""
-        with open(self.output_file, "w", encoding="utf8") as file_path:
+        """Rewrite the JSON file.
+
+        Uses orjson if it is installed. Compact output is encoded one round
+        at a time, so only a single round is held as bytes at once instead of
+        the whole demo. Otherwise the stdlib encoder streams into a large
+        write buffer so that its many small writes do not each hit the disk.
+        """
+        if orjson is not None:
+            with open(
+                self.output_file, "wb", buffering=_WRITE_BUFFER_SIZE
+            ) as file_path:
+                if (game_data := self.json) is None or self.json_indentation:
+                    file_path.write(
+                        orjson.dumps(
+                            game_data,
+                            option=(
+                                orjson.OPT_INDENT_2 if self.json_indentation else None
+                            ),
+                        )
+                    )
+                else:
+                    self._write_json_by_round(file_path, game_data, orjson.dumps)
+            return
+        with open(
+            self.output_file, "w", encoding="utf8", buffering=_WRITE_BUFFER_SIZE
+        ) as file_path:
             json.dump(
                 self.json, file_path, indent=(1 if self.json_indentation else None)
             )
 
-    def renumber_rounds(self) -> None:
+    @staticmethod
+    def _write_json_by_round(
+        file_path: BinaryIO, game_data: Game, dumps: Callable[[Any], bytes]
+    ) -> None:
+        """Write compact JSON, encoding each round separately.
+
+        Args:
+            file_path (BinaryIO): File to write the JSON to.
+            game_data (Game): Game dict to write.
+            dumps (Callable[[Any], bytes]): Encoder for a single JSON value.
+        """
+        file_path.write(b"{")
+        for key_index, (key, value) in enumerate(game_data.items()):
+            if key_index:
+                file_path.write(b",")
+            file_path.write(dumps(key) + b":")
+            if key != "gameRounds" or not (game_rounds := game_data["gameRounds"]):
+                file_path.write(dumps(value))
+                continue
+            file_path.write(b"[")
+            for round_index, game_round in enumerate(game_rounds):
+                if round_index:
+                    file_path.write(b",")
+                file_path.write(dumps(game_round))
+            file_path.write(b"]")
+        file_path.write(b"}")
+
+    def renumber_rounds(self) -> Self:
         """Renumbers the rounds.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute
                 has no "gameRounds" key.
         """
-        if self.json:
-            if self.json["gameRounds"] is None:
-                return
-            for i, _r in enumerate(self.json["gameRounds"]):
-                self.json["gameRounds"][i]["roundNum"] = i + 1
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
-
-    def renumber_frames(self) -> None:
+        if not self.json:
+            self._raise_json_not_found()
+        if (game_rounds := self.json["gameRounds"]) is None:
+            return self
+        for round_num, game_round in enumerate(game_rounds, start=1):
+            game_round["roundNum"] = round_num
+        return self
+
+    def renumber_frames(self) -> Self:
         """Renumbers the frames.
 
         Needed since cleaning can remove frames and cause
         some indices to be skipped.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute
                 has no "gameRounds" key.
         """
-        if self.json:
-            if self.json["gameRounds"] is None:
-                return
-            for index, frame in enumerate(
-                frame
-                for game_round in self.json["gameRounds"]
-                for frame in game_round["frames"] or []
-            ):
-                frame["globalFrameID"] = index
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        if not self.json:
+            self._raise_json_not_found()
+        if (game_rounds := self.json["gameRounds"]) is None:
+            return self
+        for index, frame in enumerate(
+            chain.from_iterable(
+                game_round["frames"] or () for game_round in game_rounds
+            )
+        ):
+            frame["globalFrameID"] = index
+        return self
 
-    def rescore_rounds(self) -> None:
+    def rescore_rounds(self) -> Self:
         """Rescore the rounds based on round end reason.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute
                 has no "gameRounds" key.
         """
-        if self.json:
-            if self.json["gameRounds"] is None:
-                return
-            for i, _r in enumerate(self.json["gameRounds"]):
-                if i == 0:
-                    self.json["gameRounds"][i]["tScore"] = 0
-                    self.json["gameRounds"][i]["ctScore"] = 0
-                    if self.json["gameRounds"][i]["winningSide"] == "ct":
-                        self.json["gameRounds"][i]["endCTScore"] = 1
-                        self.json["gameRounds"][i]["endTScore"] = 0
-                    if self.json["gameRounds"][i]["winningSide"] == "t":
-                        self.json["gameRounds"][i]["endCTScore"] = 0
-                        self.json["gameRounds"][i]["endTScore"] = 1
-                elif i > 0:
-                    self.json["gameRounds"][i]["tScore"] = self.json["gameRounds"][
-                        i - 1
-                    ]["endTScore"]
-                    self.json["gameRounds"][i]["ctScore"] = self.json["gameRounds"][
-                        i - 1
-                    ]["endCTScore"]
-                    if self.json["gameRounds"][i]["winningSide"] == "ct":
-                        self.json["gameRounds"][i]["endCTScore"] = (
-                            self.json["gameRounds"][i]["ctScore"] + 1
-                        )
-                        self.json["gameRounds"][i]["endTScore"] = self.json[
-                            "gameRounds"
-                        ][i]["tScore"]
-                    if self.json["gameRounds"][i]["winningSide"] == "t":
-                        self.json["gameRounds"][i]["endCTScore"] = self.json[
-                            "gameRounds"
-                        ][i]["ctScore"]
-                        self.json["gameRounds"][i]["endTScore"] = (
-                            self.json["gameRounds"][i]["tScore"] + 1
-                        )
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        if not self.json:
+            self._raise_json_not_found()
+        if (game_rounds := self.json["gameRounds"]) is None:
+            return self
+        # Each round starts from the previous round's end score.
+        t_score = ct_score = 0
+        for game_round in game_rounds:
+            game_round["tScore"] = t_score
+            game_round["ctScore"] = ct_score
+            if game_round["winningSide"] == "ct":
+                game_round["endCTScore"] = ct_score + 1
+                game_round["endTScore"] = t_score
+            if game_round["winningSide"] == "t":
+                game_round["endCTScore"] = ct_score
+                game_round["endTScore"] = t_score + 1
+            t_score = game_round["endTScore"]
+            ct_score = game_round["endCTScore"]
+        return self
 
     def _has_winner_and_not_winner(self, game_round: GameRound) -> bool:
         tie_score = 15
         ot_tie_score = 3
-        regular_valid_t_win = (game_round["endTScore"] == tie_score + 1) and (
-            game_round["endCTScore"] < tie_score
-        )
-        regular_valid_ct_win = (
-            game_round["endCTScore"] == tie_score + 1
-            and game_round["endTScore"] < tie_score
+        ct_score = game_round["endCTScore"]
+        t_score = game_round["endTScore"]
+        high_score, low_score = (
+            (ct_score, t_score) if ct_score > t_score else (t_score, ct_score)
         )
-        # OT draw scores are of the type
+        # Regulation wins end on 16. OT draw scores are of the type
         # 15 + 3xN with N a natural number(1, 2, 3, ...)
         # So 18, 21, 24, 27
         # Wins are 1 higher
         # So 19, 22, 25, 28
-        # So if you subtract 15 + 1 from an OT winning round
+        # So if you subtract 15 + 1 from any winning score
         # the number is divisible by 3
-        ot_valid_ct_win = (
-            (game_round["endCTScore"] - tie_score - 1) % ot_tie_score == 0
-            # Difference of two needed for a win. e.g 19-17
-            # Difference of one means that it was 18-18 and went to another
-            # overtime e.g. 19-18 and thus is not a win for one side yet.
-            and game_round["endTScore"] < (game_round["endCTScore"] - 1)
-            and game_round["endCTScore"] > tie_score
-        )
-        ot_valid_t_win = (
-            (game_round["endTScore"] - tie_score - 1) % ot_tie_score == 0
-            and game_round["endCTScore"] < (game_round["endTScore"] - 1)
-            and game_round["endTScore"] > tie_score
-        )
+        # A difference of two is needed for a win. e.g 19-17
+        # A difference of one means that it was 18-18 and went to another
+        # overtime e.g. 19-18 and thus is not a win for one side yet.
+        # In regulation that rules out 16-15, which continues into overtime.
         return (
-            regular_valid_ct_win
-            or regular_valid_t_win
-            or ot_valid_ct_win
-            or ot_valid_t_win
+            high_score > tie_score
+            and (high_score - tie_score - 1) % ot_tie_score == 0
+            and high_score - low_score > 1
         )
 
-    def remove_bad_scoring(self) -> None:
+    def remove_bad_scoring(self) -> Self:
         """Removes rounds where the scoring is bad.
 
         We loop through the rounds:
         If the round ahead has equal or less score, we do not add the current round.
         If the round ahead has +1 score, we add the current round
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            if self.json["gameRounds"] is None:
-                return
-            cleaned_rounds = []
-            for i, game_round in enumerate(self.json["gameRounds"]):
-                current_round_total = (
-                    game_round["tScore"]
-                    + game_round["endTScore"]
-                    + game_round["ctScore"]
-                    + game_round["endCTScore"]
-                )
-                lookback_round = self.json["gameRounds"][i - 1]
-                lookback_round_total = (
-                    lookback_round["tScore"]
-                    + lookback_round["endTScore"]
-                    + lookback_round["ctScore"]
-                    + lookback_round["endCTScore"]
-                )
-                # Last round just have to have a higher score than the previous
-                if (
-                    i == (len(self.json["gameRounds"]) - 1)
-                    and current_round_total > lookback_round_total
-                ):
+        if not (game_data := self.json):
+            self._raise_json_not_found()
+        if not (game_rounds := game_data["gameRounds"]):
+            return self
+        # Every round is compared to both neighbours,
+        # so compute each total once up front.
+        totals = [
+            game_round["tScore"]
+            + game_round["endTScore"]
+            + game_round["ctScore"]
+            + game_round["endCTScore"]
+            for game_round in game_rounds
+        ]
+        last_index = len(game_rounds) - 1
+        cleaned_rounds = []
+        for i, game_round in enumerate(game_rounds):
+            current_round_total = totals[i]
+            lookback_round_total = totals[i - 1]
+            # Last round just have to have a higher score than the previous
+            if i == last_index:
+                if current_round_total > lookback_round_total:
                     cleaned_rounds.append(game_round)
-                # Other rounds have more criteria
-                # They need to have a lower score than the next round
-                # Or when they are the round that causes the game to end in a win
-                # Then they just need more rounds than the previous.
-                # Rounds after are likely not real anymore.
-                elif i < (len(self.json["gameRounds"]) - 1):
-                    lookahead_round = self.json["gameRounds"][i + 1]
-                    lookahead_round_total = (
-                        lookahead_round["tScore"]
-                        + lookahead_round["endTScore"]
-                        + lookahead_round["ctScore"]
-                        + lookahead_round["endCTScore"]
-                    )
-                    if (lookahead_round_total > current_round_total) or (
-                        self._has_winner_and_not_winner(game_round)
-                        and current_round_total > lookback_round_total
-                    ):
-                        cleaned_rounds.append(game_round)
+            # Other rounds have more criteria
+            # They need to have a lower score than the next round
+            # Or when they are the round that causes the game to end in a win
+            # Then they just need more rounds than the previous.
+            # Rounds after are likely not real anymore.
+            elif (totals[i + 1] > current_round_total) or (
+                self._has_winner_and_not_winner(game_round)
+                and current_round_total > lookback_round_total
+            ):
+                cleaned_rounds.append(game_round)
+
+        game_data["gameRounds"] = cleaned_rounds
+        return self
+
+    def _filter_rounds(
+        self,
+        *predicates: Callable[[GameRound], bool],
+        keep_missing_rounds: bool = False,
+    ) -> Self:
+        """Keep only the rounds that pass every predicate.
+
+        All predicates are checked in a single pass over the rounds.
+        The kept rounds then replace the contents of the existing list.
 
-            self.json["gameRounds"] = cleaned_rounds
+        Args:
+            *predicates (Callable[[GameRound], bool]): Functions that return
+                True for rounds that should be kept.
+            keep_missing_rounds (bool, optional): Whether to leave a gameRounds
+                of None as is instead of replacing it with an empty list.
+                Defaults to False.
+
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
+        Raises:
+            AttributeError: Raises an AttributeError if the .json attribute is None
+        """
+        if not (game_data := self.json):
+            self._raise_json_not_found()
+        if not (game_rounds := game_data["gameRounds"]):
+            if game_rounds is None and not keep_missing_rounds:
+                game_data["gameRounds"] = []
+            return self
+        if len(predicates) == 1:
+            # The public cleaners pass a single predicate,
+            # which map can call directly without an all() per round.
+            keep = list(map(predicates[0], game_rounds))
         else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+            keep = [
+                all(predicate(game_round) for predicate in predicates)
+                for game_round in game_rounds
+            ]
+        game_rounds[:] = compress(game_rounds, keep)
+        return self
+
+    def _can_clean_frames(self, cleaner: str) -> bool:
+        """Check that frames were parsed for a cleaner that relies on them.
+
+        Args:
+            cleaner (str): Name of the cleaner to mention in the warning.
+
+        Returns:
+            bool: Whether frames were parsed.
+        """
+        if not self.parse_frames:
+            self.logger.warning(
+                "parse_frames is set to False, "
+                "must be true for %s to work. "
+                "Skipping %s.",
+                cleaner,
+                cleaner,
+            )
+            return False
+        return True
+
+    # Optional lists in the game JSON are either a list or None, so the
+    # checks below fall back to the empty tuple, a cached singleton, for None.
+    @staticmethod
+    def _has_frames(game_round: GameRound) -> bool:
+        return bool(game_round["frames"])
 
-    def remove_rounds_with_no_frames(self) -> None:
+    def remove_rounds_with_no_frames(self) -> Self:
         """Removes rounds with no frames.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            if not self.parse_frames:
-                self.logger.warning(
-                    "parse_frames is set to False, "
-                    "must be true for remove_no_frames to work. "
-                    "Skipping remove_no_frames."
-                )
-            else:
-                cleaned_rounds = [
-                    game_round
-                    for game_round in self.json["gameRounds"] or []
-                    if len(game_round["frames"] or []) > 0
-                ]
-                self.json["gameRounds"] = cleaned_rounds
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        if not self.json:
+            self._raise_json_not_found()
+        if self._can_clean_frames("remove_no_frames"):
+            self._filter_rounds(self._has_frames)
+        return self
+
+    @staticmethod
+    def _has_valid_player_counts(game_round: GameRound) -> bool:
+        if not game_round["frames"]:
+            return False
+        game_frame = game_round["frames"][0]
+        player_lists = (
+            game_frame["t"]["players"],
+            game_frame["ct"]["players"],
+        )
+        # Remove if any side has > 5 players
+        # Remove if both sides are None
+        return all(
+            len(player_list or ()) <= _MAX_TEAM_PLAYERS for player_list in player_lists
+        ) and any(player_list is not None for player_list in player_lists)
 
-    def remove_excess_players(self) -> None:
+    def remove_excess_players(self) -> Self:
         """Removes rounds where there are more than 5 players on a side.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            if not self.parse_frames:
-                self.logger.warning(
-                    "parse_frames is set to False, "
-                    "must be true for remove_excess_players to work. "
-                    "Skipping remove_excess_players."
-                )
-            else:
-                cleaned_rounds = []
-                # Remove rounds where the number of players is too large
-                n_players = 5
-                for game_round in self.json["gameRounds"] or []:
-                    if not game_round["frames"]:
-                        continue
-                    game_frame = game_round["frames"][0]
-                    player_lists = (
-                        game_frame["t"]["players"],
-                        game_frame["ct"]["players"],
-                    )
-                    # Remove if any side has > 5 players
-                    # Remove if both sides are None
-                    if all(
-                        len(player_list or []) <= n_players
-                        for player_list in player_lists
-                    ) and any(player_list is not None for player_list in player_lists):
-                        cleaned_rounds.append(game_round)
-                self.json["gameRounds"] = cleaned_rounds
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        if not self.json:
+            self._raise_json_not_found()
+        if self._can_clean_frames("remove_excess_players"):
+            self._filter_rounds(self._has_valid_player_counts)
+        return self
 
-    def remove_warmups(self) -> None:
+    @staticmethod
+    def _is_not_warmup(game_round: GameRound) -> bool:
+        return not game_round["isWarmup"]
+
+    def remove_warmups(self) -> Self:
         """Removes warmup rounds.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            cleaned_rounds = [
-                game_round
-                for game_round in self.json["gameRounds"] or []
-                if not game_round["isWarmup"]
-            ]
-            self.json["gameRounds"] = cleaned_rounds
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        return self._filter_rounds(self._is_not_warmup)
+
+    @staticmethod
+    def _has_good_ending(
+        game_round: GameRound, bad_endings: Collection[str] = _BAD_ROUND_ENDINGS
+    ) -> bool:
+        return game_round["roundEndReason"] not in bad_endings
 
-    def remove_end_round(self, bad_endings: list[str] | None = None) -> None:
+    def remove_end_round(self, bad_endings: list[str] | None = None) -> Self:
         """Removes rounds with bad end reason.
 
         Args:
             bad_endings (list, optional): List of bad round end reasons.
                 Defaults to ["Draw", "Unknown", ""].
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
         if bad_endings is None:
-            bad_endings = ["Draw", "Unknown", ""]
-        if self.json:
-            if (game_rounds := self.json["gameRounds"]) is None:
-                return
-            cleaned_rounds = [
-                game_round
-                for game_round in game_rounds
-                if game_round["roundEndReason"] not in bad_endings
-            ]
-            self.json["gameRounds"] = cleaned_rounds
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+            return self._filter_rounds(self._has_good_ending, keep_missing_rounds=True)
+        bad_ending_set = frozenset(bad_endings)
+        return self._filter_rounds(
+            lambda game_round: self._has_good_ending(game_round, bad_ending_set),
+            keep_missing_rounds=True,
+        )
 
-    def remove_knife_rounds(self) -> None:
+    @staticmethod
+    def _is_not_knife_round(game_round: GameRound) -> bool:
+        if game_round["isWarmup"]:
+            return False
+        if (kill_actions := game_round["kills"]) is None:
+            return False
+        # Keep rounds without kills or with at least one non knife kill.
+        # any() stops at the first non knife kill, which is usually the first.
+        return not kill_actions or any(k["weapon"] != "Knife" for k in kill_actions)
+
+    def remove_knife_rounds(self) -> Self:
         """Removes knife rounds.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            if (game_rounds := self.json["gameRounds"]) is None:
-                return
-            cleaned_rounds = []
-            for game_round in game_rounds:
-                if game_round["isWarmup"]:
-                    continue
-                if (kill_actions := game_round["kills"]) is None:
-                    continue
-                total_kills = len(kill_actions)
-                total_knife_kills = sum(
-                    1 for k in kill_actions if k["weapon"] == "Knife"
-                )
-                if (total_knife_kills != total_kills) | (total_knife_kills == 0):
-                    cleaned_rounds.append(game_round)
-            self.json["gameRounds"] = cleaned_rounds
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        return self._filter_rounds(self._is_not_knife_round, keep_missing_rounds=True)
 
-    def remove_excess_kill_rounds(self) -> None:
+    @staticmethod
+    def _has_valid_kill_count(game_round: GameRound) -> bool:
+        return (
+            not game_round["isWarmup"]
+            and len(game_round["kills"] or ()) <= _MAX_ROUND_KILLS
+        )
+
+    def remove_excess_kill_rounds(self) -> Self:
         """Removes rounds with more than 10 kills.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            n_total_players = 10
-            cleaned_rounds = [
-                game_round
-                for game_round in self.json["gameRounds"] or []
-                if (
-                    not game_round["isWarmup"]
-                    and len(game_round["kills"] or []) <= n_total_players
-                )
-            ]
-            self.json["gameRounds"] = cleaned_rounds
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        return self._filter_rounds(self._has_valid_kill_count)
+
+    @staticmethod
+    def _has_valid_timings(game_round: GameRound) -> bool:
+        (
+            start_tick,
+            end_tick,
+            end_official_tick,
+            freeze_time_end_tick,
+        ) = _ROUND_TICK_GETTER(game_round)
+        return (
+            start_tick <= end_tick
+            and start_tick <= end_official_tick
+            and start_tick <= freeze_time_end_tick
+        )
 
-    def remove_time_rounds(self) -> None:
+    def remove_time_rounds(self) -> Self:
         """Remove rounds with odd round timings.
 
+        Returns:
+            DemoParser: The parser itself, so that cleaners can be chained.
+
         Raises:
             AttributeError: Raises an AttributeError if the .json attribute is None
         """
-        if self.json:
-            cleaned_rounds = [
-                game_round
-                for game_round in self.json["gameRounds"] or []
-                if (
-                    (game_round["startTick"] <= game_round["endTick"])
-                    and (game_round["startTick"] <= game_round["endOfficialTick"])
-                    and (game_round["startTick"] <= game_round["freezeTimeEndTick"])
-                )
-            ]
-            self.json["gameRounds"] = cleaned_rounds
-        else:
-            msg = "JSON not found. Run .parse() or .read_json() if JSON already exists"
-            self.logger.error(msg)
-            raise AttributeError(msg)
+        return self._filter_rounds(self._has_valid_timings)
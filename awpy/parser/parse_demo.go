@@ -2589,6 +2589,11 @@ func cleanAndWriteGame(currentGame *Game, jsonIndentation bool, outpath string)
 		file, err = json.Marshal(currentGame)
 	}
 	checkError(err)
+	// An outpath of "-" streams the JSON to stdout instead of writing a file
+	if outpath == "-" {
+		_, _ = os.Stdout.Write(file)
+		return
+	}
 	_ = os.WriteFile(outpath+"/"+currentGame.MatchName+".json", file, 0600)
 }
 
@@ -2615,7 +2620,7 @@ func main() {
 	demoIDPtr := fl.String("demoid", "", "Demo string ID")
 	jsonIndentationPtr := fl.Bool("jsonindentation", false, "Indent JSON file")
 	parseChatPtr := fl.Bool("parsechat", false, "Parse chat messages")
-	outpathPtr := fl.String("out", "", "Path to write output JSON")
+	outpathPtr := fl.String("out", "", "Path to write output JSON, or - for stdout")
 
 	err := fl.Parse(os.Args[1:])
 	checkError(err)
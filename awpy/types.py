@@ -621,6 +621,29 @@ class Game(TypedDict):
     gameRounds: list[GameRound] | None
 
 
+class GameHeader(TypedDict):
+    """GameHeader holds the top level fields of a Game.
+
+    The rounds are left untyped so that the overall shape of a Game
+    can be checked without validating every single round.
+    """
+
+    matchID: str
+    clientName: str
+    mapName: str
+    tickRate: int
+    playbackTicks: int
+    playbackFramesCount: int
+    parsedToFrameIdx: int
+    parserParameters: ParserOpts
+    serverVars: ServerConVar
+    matchPhases: MatchPhases
+    matchmakingRanks: list[MMRank] | None
+    chatMessages: list[Chat] | None
+    playerConnections: list[ConnectAction] | None
+    gameRounds: list[object] | None
+
+
 class PlayerStatistics(TypedDict):
     """Type for the result of awpy.analytics.stats.player_stats."""
 
@@ -26,6 +26,10 @@ setup(
         "tqdm~=4.65.0",
         "typing_extensions~=4.7.0",
     ],
+    extras_require={
+        # Faster JSON reading and writing for large demos
+        "fast": ["orjson>=3.8"],
+    },
     package_data={
         # If any package contains *.txt or *.rst files, include them:
         "": [
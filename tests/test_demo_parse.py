@@ -1,6 +1,8 @@
 """Tests DemoParser functionality."""
+import json
 import logging
 import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -178,6 +180,39 @@ class TestDemoParser:
         with pytest.raises(FileNotFoundError):
             bad_path_parser.read_json("bad_json.json")
 
+    def test_read_json_validate(self, tmp_path: Path, caplog: pytest.LogCaptureFixture):
+        """Tests that read_json only validates the JSON shape when asked to."""
+        json_path = os.path.join(tmp_path, "bad_shape.json")
+        with open(json_path, "w", encoding="utf8") as json_file:
+            json_file.write('{"matchID": 1}')
+        validate_parser = DemoParser(log=True)
+        caplog.set_level(logging.ERROR)
+        assert validate_parser.read_json(json_path, validate=False) == {"matchID": 1}
+        assert "does not have correct fields" not in caplog.text
+        assert validate_parser.read_json(json_path) == {"matchID": 1}
+        assert "does not have correct fields" in caplog.text
+
+    def test_write_json(self, tmp_path: Path):
+        """Tests that write_json round-trips the JSON."""
+        write_parser = DemoParser(log=False)
+        write_parser.output_file = os.path.join(tmp_path, "written.json")
+        game_data = {
+            "matchID": "write-test",
+            "gameRounds": [{"roundNum": 1}, {"roundNum": 2, "kills": None}],
+            "matchPhases": {"announcementLastRoundHalf": [1.5]},
+        }
+        write_parser.json = game_data
+        for json_indentation in (True, False):
+            write_parser.json_indentation = json_indentation
+            write_parser.write_json()
+            with open(write_parser.output_file, encoding="utf8") as json_file:
+                assert json.load(json_file) == game_data
+        # Like the stdlib path, a missing JSON is written as null.
+        write_parser.json = None
+        write_parser.write_json()
+        with open(write_parser.output_file, encoding="utf8") as json_file:
+            assert json.load(json_file) is None
+
     def test_parse_output_type(self):
         """Tests if the JSON output from parse is a dict."""
         output_json = self.parser.parse()
@@ -189,6 +224,18 @@ class TestDemoParser:
         )
         assert self.parser.parse_error is False
 
+    def test_parse_stream(self):
+        """Tests that streaming the Go output matches the file round-trip."""
+        stream_parser = DemoParser(
+            demofile="tests/default.dem", log=False, parse_rate=256
+        )
+        streamed_data = stream_parser.parse(clean=False, stream=True)
+        assert stream_parser.parse_error is False
+        file_data = DemoParser(
+            demofile="tests/default.dem", log=False, parse_rate=256
+        ).parse(clean=False)
+        assert streamed_data == file_data
+
     def test_parse_valve_matchmaking(self):
         """Tests if demos parse correctly."""
         self.valve_mm = DemoParser(
@@ -578,8 +625,9 @@ class TestDemoParser:
             demofile="tests/default.dem", log=False, parse_rate=256
         )
         error_parser.json = None
-        with patch.object(error_parser, "read_json") as read_mock, patch.object(
-            error_parser, "parse_demo"
+        # DemoParser uses __slots__, so methods are patched on the class.
+        with patch.object(DemoParser, "read_json") as read_mock, patch.object(
+            DemoParser, "parse_demo"
         ) as parse_mock:
             with pytest.raises(AttributeError):
                 error_parser.parse(clean=False)
@@ -618,6 +666,13 @@ class TestDemoParser:
             "matchPhases": {"warmupChanged": []},
         }
         falsy_game_rounds_parser.clean_rounds()
+        assert falsy_game_rounds_parser.json["gameRounds"] == []
+        # These two cleaners leave a missing round list untouched.
+        falsy_game_rounds_parser.json["gameRounds"] = None
+        falsy_game_rounds_parser.remove_knife_rounds().remove_end_round()
+        assert falsy_game_rounds_parser.json["gameRounds"] is None
+        falsy_game_rounds_parser.remove_warmups()
+        assert falsy_game_rounds_parser.json["gameRounds"] == []
         falsy_game_rounds_parser.json = {
             "gameRounds": [],
             "matchPhases": {"warmupChanged": []},
@@ -720,3 +775,30 @@ class TestDemoParser:
             for frame in game_round["frames"]
         ):
             assert index == frame["globalFrameID"]
+
+    def test_clean_rounds_matches_cleaners(self):
+        """Tests that clean_rounds matches running the cleaners one by one."""
+        self.sequential_parser = DemoParser(
+            demofile="tests/esea_match_16902209.dem", log=False, parse_frames=True
+        )
+        self.sequential_parser.parse(clean=False)
+        # Cleaners return the parser, so they can be chained.
+        assert (
+            self.sequential_parser.remove_rounds_with_no_frames()
+            .remove_warmups()
+            .remove_knife_rounds()
+            .remove_time_rounds()
+            .remove_excess_players()
+            .remove_excess_kill_rounds()
+            .remove_end_round()
+            .remove_bad_scoring()
+            .renumber_rounds()
+            .renumber_frames()
+        ) is self.sequential_parser
+
+        self.fused_parser = DemoParser(
+            demofile="tests/esea_match_16902209.dem", log=False, parse_frames=True
+        )
+        self.fused_parser.parse(clean=False)
+        cleaned_data = self.fused_parser.clean_rounds(save_to_json=False)
+        assert cleaned_data["gameRounds"] == self.sequential_parser.json["gameRounds"]